@@ -1,16 +1,19 @@
 """FastAPI route definitions."""
 
-import json
+import asyncio
+import os
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from ..config import get_config, get_project_root
-from ..database import get_db
+from ..database import get_db, get_db_async
 from ..models import (
     ChannelCreate,
     ChannelResponse,
@@ -23,27 +26,53 @@ from ..models import (
     TranscriptResponse,
     VideoDetailResponse,
     VideoResponse,
+    from_orm_fast,
 )
 from ..processors import Summarizer
 from ..storage import Repository
+from ..utils import utcnow
 from .. import __version__
 
 router = APIRouter()
 
+# Shared Summarizer used only to probe Ollama from /health; built once
+# instead of per request
+_summarizer_probe: Optional[Summarizer] = None
+
+
+def _get_summarizer_probe() -> Summarizer:
+    """Get the shared Summarizer used for health probes."""
+    global _summarizer_probe
+    if _summarizer_probe is None:
+        _summarizer_probe = Summarizer()
+    return _summarizer_probe
+
+
+# How long /health may report a stale Ollama status; the Summarizer's
+# probe cache honors this ttl, so no second cache layer is needed here
+_OLLAMA_PROBE_TTL_SECONDS = 5.0
+
+
+def _probe_ollama() -> str:
+    """Probe Ollama availability, cached for a few seconds."""
+    summarizer = _get_summarizer_probe()
+    available = summarizer.check_ollama_available(ttl=_OLLAMA_PROBE_TTL_SECONDS)
+    return "ok" if available else "unavailable"
+
 
 @router.get("/health", response_model=HealthResponse)
-def health_check(db: Session = Depends(get_db)):
+async def health_check(db: AsyncSession = Depends(get_db_async)):
     """Health check endpoint."""
     # Check database
     db_status = "ok"
     try:
-        db.execute(text("SELECT 1"))
+        await db.execute(text("SELECT 1"))
     except Exception:
         db_status = "error"
 
-    # Check Ollama
-    summarizer = Summarizer()
-    ollama_status = "ok" if summarizer.check_ollama_available() else "unavailable"
+    # Check Ollama (cached for a few seconds); the probe is a blocking
+    # HTTP call, so run it in a worker thread instead of on the loop
+    ollama_status = await asyncio.to_thread(_probe_ollama)
 
     return HealthResponse(
         status="healthy" if db_status == "ok" else "degraded",
@@ -54,163 +83,197 @@ def health_check(db: Session = Depends(get_db)):
 
 
 @router.get("/channels", response_model=list[ChannelResponse])
-def list_channels(
+async def list_channels(
     active_only: bool = Query(False, description="Only return active channels"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db_async),
 ):
     """List all channels."""
-    repo = Repository(db)
-    channels = repo.get_channels(active_only=active_only)
-    return channels
+    channels = await db.run_sync(
+        lambda session: Repository(session).get_channels(active_only=active_only)
+    )
+    return [from_orm_fast(ChannelResponse, channel) for channel in channels]
 
 
 @router.post("/channels", response_model=ChannelResponse, status_code=201)
-def create_channel(channel: ChannelCreate, db: Session = Depends(get_db)):
+async def create_channel(channel: ChannelCreate, db: AsyncSession = Depends(get_db_async)):
     """Add a new channel to watch."""
-    repo = Repository(db)
 
-    # Check if channel already exists
-    existing = repo.get_channel(channel.id)
-    if existing:
-        raise HTTPException(status_code=400, detail="Channel already exists")
+    def _create(session: Session):
+        repo = Repository(session)
 
-    return repo.create_channel(channel)
+        # Check if channel already exists
+        existing = repo.get_channel(channel.id)
+        if existing:
+            raise HTTPException(status_code=400, detail="Channel already exists")
+
+        return repo.create_channel(channel)
+
+    return await db.run_sync(_create)
 
 
 @router.get("/videos", response_model=list[VideoResponse])
-def list_videos(
+async def list_videos(
     status: Optional[str] = Query(None, description="Filter by status"),
     channel_id: Optional[str] = Query(None, description="Filter by channel"),
     limit: int = Query(50, ge=1, le=100, description="Maximum results"),
     offset: int = Query(0, ge=0, description="Offset for pagination"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db_async),
 ):
     """List videos with optional filtering."""
-    repo = Repository(db)
-    videos = repo.get_videos(status=status, channel_id=channel_id, limit=limit, offset=offset)
-
-    # Add channel names
-    result = []
-    for video in videos:
-        response = VideoResponse.model_validate(video)
-        if video.channel:
-            response.channel_name = video.channel.name
-        result.append(response)
+    videos = await db.run_sync(
+        lambda session: Repository(session).get_videos(
+            status=status, channel_id=channel_id, limit=limit, offset=offset
+        )
+    )
 
-    return result
+    # Rows come straight from the DB, so skip per-row pydantic validation
+    return [
+        from_orm_fast(
+            VideoResponse,
+            video,
+            channel_name=video.channel.name if video.channel else None,
+        )
+        for video in videos
+    ]
 
 
 @router.get("/videos/{video_id}", response_model=VideoDetailResponse)
-def get_video(video_id: str, db: Session = Depends(get_db)):
+async def get_video(video_id: str, db: AsyncSession = Depends(get_db_async)):
     """Get video details including transcript and summary."""
-    repo = Repository(db)
-    video = repo.get_video(video_id)
-
-    if not video:
-        raise HTTPException(status_code=404, detail="Video not found")
-
-    response = VideoDetailResponse(
-        id=video.id,
-        channel_id=video.channel_id,
-        title=video.title,
-        url=video.url,
-        published_at=video.published_at,
-        duration_seconds=video.duration_seconds,
-        status=video.status,
-        created_at=video.created_at,
-    )
 
-    if video.channel:
-        response.channel_name = video.channel.name
+    def _load(session: Session):
+        repo = Repository(session)
+        video = repo.get_video(video_id)
+
+        if not video:
+            raise HTTPException(status_code=404, detail="Video not found")
 
-    if video.transcript:
-        response.transcript = video.transcript.text
+        summary_text = None
+        category = None
+        key_points = None
+        summary = repo.get_summary(video_id)
+        if summary:
+            summary_text = summary.summary_text
+            category = summary.category
+            key_points = summary.key_points
 
-    summary = repo.get_summary(video_id)
-    if summary:
-        response.summary = summary.summary_text
-        response.category = summary.category
-        if summary.key_points:
-            try:
-                response.key_points = json.loads(summary.key_points)
-            except json.JSONDecodeError:
-                response.key_points = []
+        return from_orm_fast(
+            VideoDetailResponse,
+            video,
+            channel_name=video.channel.name if video.channel else None,
+            transcript=video.transcript.text if video.transcript else None,
+            summary=summary_text,
+            key_points=key_points,
+            category=category,
+        )
 
-    return response
+    return await db.run_sync(_load)
 
 
 @router.get("/videos/{video_id}/transcript", response_model=TranscriptResponse)
-def get_video_transcript(video_id: str, db: Session = Depends(get_db)):
+async def get_video_transcript(video_id: str, db: AsyncSession = Depends(get_db_async)):
     """Get raw transcript for a video."""
-    repo = Repository(db)
-    transcript = repo.get_transcript(video_id)
+    transcript = await db.run_sync(
+        lambda session: Repository(session).get_transcript(video_id)
+    )
 
     if not transcript:
         raise HTTPException(status_code=404, detail="Transcript not found")
 
-    return transcript
+    return from_orm_fast(TranscriptResponse, transcript)
+
+
+@lru_cache(maxsize=32)
+def _load_digest_cached(path: str, mtime_ns: int) -> DigestResponse:
+    """Load and cache a digest file, keyed by path and mtime."""
+    return DigestResponse.model_validate_json(Path(path).read_bytes())
 
 
 @router.get("/digests/latest", response_model=DigestResponse)
-def get_latest_digest(db: Session = Depends(get_db)):
+async def get_latest_digest(db: AsyncSession = Depends(get_db_async)):
     """Get the latest daily digest."""
     config = get_config()
     digests_dir = get_project_root() / config.storage.digests_dir
 
-    # Find the most recent digest JSON file
-    digest_files = sorted(digests_dir.glob("digest_*.json"), reverse=True)
+    # Prefer the LATEST pointer written by the digest generator
+    latest = None
+    try:
+        name = (digests_dir / "LATEST").read_text().strip()
+        candidate = digests_dir / name
+        if candidate.exists():
+            latest = candidate
+    except FileNotFoundError:
+        pass
+
+    if latest is None:
+        # Fall back to scanning the digests directory; scandir avoids a
+        # Path object and extra stat per entry
+        newest = None
+        try:
+            with os.scandir(digests_dir) as entries:
+                newest = max(
+                    (
+                        entry
+                        for entry in entries
+                        if entry.name.startswith("digest_") and entry.name.endswith(".json")
+                    ),
+                    key=lambda entry: entry.name,
+                    default=None,
+                )
+        except FileNotFoundError:
+            pass
 
-    if not digest_files:
-        # Generate on-the-fly if no saved digest
-        return generate_digest_for_date(datetime.utcnow().date().isoformat(), db)
+        if newest is None:
+            # Generate on-the-fly if no saved digest
+            return await generate_digest_for_date(utcnow().date().isoformat(), db)
 
-    # Load the most recent digest
-    with open(digest_files[0]) as f:
-        data = json.load(f)
+        latest = Path(newest.path)
 
-    return DigestResponse(**data)
+    # Load the most recent digest
+    return _load_digest_cached(str(latest), latest.stat().st_mtime_ns)
 
 
 @router.get("/digests/{date}", response_model=DigestResponse)
-def get_digest_by_date(date: str, db: Session = Depends(get_db)):
+async def get_digest_by_date(date: str, db: AsyncSession = Depends(get_db_async)):
     """Get digest for a specific date (YYYY-MM-DD)."""
     config = get_config()
     digests_dir = get_project_root() / config.storage.digests_dir
     digest_path = digests_dir / f"digest_{date}.json"
 
-    if digest_path.exists():
-        with open(digest_path) as f:
-            data = json.load(f)
-        return DigestResponse(**data)
+    try:
+        mtime_ns = digest_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        mtime_ns = None
+
+    if mtime_ns is not None:
+        return _load_digest_cached(str(digest_path), mtime_ns)
 
     # Generate on-the-fly
-    return generate_digest_for_date(date, db)
+    return await generate_digest_for_date(date, db)
 
 
-def generate_digest_for_date(date: str, db: Session) -> DigestResponse:
+async def generate_digest_for_date(date: str, db: AsyncSession) -> DigestResponse:
     """Generate a digest for a specific date."""
     try:
         target_date = datetime.fromisoformat(date)
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
 
-    repo = Repository(db)
-
     # Get videos from the last 24 hours of the target date
     since = target_date - timedelta(days=1)
-    videos = repo.get_videos_since(since)
+
+    def _load(session: Session):
+        repo = Repository(session)
+        videos = repo.get_videos_since(since)
+        summaries = repo.get_summaries_for_videos([video.id for video in videos])
+        return videos, summaries
+
+    videos, summaries = await db.run_sync(_load)
 
     digest_videos = []
     for video in videos:
-        summary = repo.get_summary(video.id)
+        summary = summaries.get(video.id)
         if summary:
-            key_points = []
-            if summary.key_points:
-                try:
-                    key_points = json.loads(summary.key_points)
-                except json.JSONDecodeError:
-                    pass
-
             digest_videos.append(
                 DigestVideo(
                     title=video.title,
@@ -218,14 +281,14 @@ def generate_digest_for_date(date: str, db: Session) -> DigestResponse:
                     channel=video.channel.name if video.channel else "Unknown",
                     published=video.published_at,
                     summary=summary.summary_text,
-                    key_points=key_points,
-                    category=summary.category or "ai",
+                    key_points=summary.key_points or [],
+                    category=summary.category,
                 )
             )
 
     return DigestResponse(
         source="signal-watch",
-        generated_at=datetime.utcnow(),
+        generated_at=utcnow(),
         date=date,
         videos=digest_videos,
     )
@@ -242,25 +305,28 @@ def trigger_poll(db: Session = Depends(get_db)):
 
 
 @router.get("/runs", response_model=list[RunResponse])
-def list_runs(
+async def list_runs(
     limit: int = Query(10, ge=1, le=50, description="Maximum results"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db_async),
 ):
     """List recent pipeline runs."""
-    repo = Repository(db)
-    return repo.get_runs(limit=limit)
+    runs = await db.run_sync(lambda session: Repository(session).get_runs(limit=limit))
+    return [from_orm_fast(RunResponse, run) for run in runs]
 
 
 @router.get("/stats", response_model=StatsResponse)
-def get_stats(db: Session = Depends(get_db)):
+async def get_stats(db: AsyncSession = Depends(get_db_async)):
     """Get database statistics."""
-    repo = Repository(db)
-    stats = repo.get_stats()
 
-    latest_run = repo.get_latest_run()
+    def _load(session: Session):
+        repo = Repository(session)
+        return repo.get_stats(), repo.get_latest_run()
+
+    stats, latest_run = await db.run_sync(_load)
+
     run_response = None
     if latest_run:
-        run_response = RunResponse.model_validate(latest_run)
+        run_response = from_orm_fast(RunResponse, latest_run)
 
     return StatsResponse(
         total_channels=stats["total_channels"],
@@ -1,6 +1,8 @@
 """Configuration loading for Signal Watch."""
 
 import os
+import pickle
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -24,6 +26,7 @@ class SettingsConfig(BaseModel):
     max_videos_per_poll: int = 10
     transcript_timeout_seconds: int = 30
     summary_model: str = "deepseek-coder-v2:16b"
+    summary_concurrency: int = 2
     digest_hour: int = 6
 
 
@@ -50,11 +53,16 @@ class AppSettings(BaseSettings):
     ollama_host: str = "http://localhost:11434"
 
 
+@lru_cache(maxsize=1)
 def get_project_root() -> Path:
     """Get the project root directory."""
     return Path(__file__).parent.parent
 
 
+# Use the C-accelerated YAML loader when libyaml is available
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
 def load_config(config_path: Optional[str] = None) -> Config:
     """Load configuration from YAML file."""
     if config_path is None:
@@ -67,23 +75,60 @@ def load_config(config_path: Optional[str] = None) -> Config:
         return Config()
 
     with open(full_path) as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=_YamlLoader)
 
     return Config(**data)
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> AppSettings:
-    """Get application settings."""
+    """Get application settings (validated once per process)."""
     return AppSettings()
 
 
-# Global config instance
-_config: Optional[Config] = None
+def reset_settings_cache() -> None:
+    """Clear the cached settings (for tests)."""
+    get_settings.cache_clear()
+
+
+# Pickled copy of the validated Config, shared across processes
+_PICKLE_CACHE_NAME = ".config_cache.pkl"
+
+
+@lru_cache(maxsize=4)
+def _load_config_cached(config_path: str, mtime_ns: int) -> Config:
+    """Load and cache a config file, keyed by path and mtime."""
+    cache_path = get_project_root() / _PICKLE_CACHE_NAME
+
+    # Reuse the pickled config if it is newer than the YAML
+    try:
+        if cache_path.stat().st_mtime_ns >= mtime_ns:
+            with open(cache_path, "rb") as f:
+                cached_path, cached_config = pickle.load(f)
+            if cached_path == config_path and isinstance(cached_config, Config):
+                return cached_config
+    except (OSError, pickle.PickleError, ValueError, TypeError):
+        pass
+
+    config = load_config(config_path)
+
+    try:
+        with open(cache_path, "wb") as f:
+            pickle.dump((config_path, config), f)
+    except OSError:
+        pass
+
+    return config
 
 
 def get_config() -> Config:
-    """Get the global configuration."""
-    global _config
-    if _config is None:
-        _config = load_config()
-    return _config
+    """Get the global configuration, re-parsing only when the file changes."""
+    config_path = os.getenv("SIGNAL_WATCH_CONFIG_PATH", "config/channels.yaml")
+    full_path = get_project_root() / config_path
+
+    try:
+        mtime_ns = full_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return Config()
+
+    return _load_config_cached(config_path, mtime_ns)
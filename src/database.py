@@ -2,10 +2,12 @@
 
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Generator
+from typing import AsyncGenerator, Generator
 
-from sqlalchemy import create_engine, event
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool
 
 from .config import get_config, get_project_root
 from .models import Base
@@ -18,25 +20,76 @@ def get_database_url() -> str:
     return f"sqlite:///{db_path}"
 
 
+def get_async_database_url() -> str:
+    """Get the async (aiosqlite) database URL from config."""
+    config = get_config()
+    db_path = get_project_root() / config.storage.database
+    return f"sqlite+aiosqlite:///{db_path}"
+
+
+def _register_sqlite_events(engine) -> None:
+    """Tune SQLite for the write-heavy pipeline."""
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragma(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.execute("PRAGMA cache_size=-64000")
+        cursor.execute("PRAGMA busy_timeout=5000")
+        cursor.close()
+
+    @event.listens_for(engine, "close")
+    def optimize_sqlite(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA optimize")
+        cursor.close()
+
+
 def create_db_engine(database_url: str | None = None):
     """Create the database engine."""
     url = database_url or get_database_url()
-    engine = create_engine(url, echo=False)
 
-    # Enable foreign keys for SQLite
     if url.startswith("sqlite"):
-        @event.listens_for(engine, "connect")
-        def set_sqlite_pragma(dbapi_connection, connection_record):
-            cursor = dbapi_connection.cursor()
-            cursor.execute("PRAGMA foreign_keys=ON")
-            cursor.close()
+        # Pool connections so the pragma handler runs once per pooled
+        # connection instead of on every request
+        engine = create_engine(
+            url,
+            echo=False,
+            poolclass=QueuePool,
+            pool_size=5,
+            max_overflow=10,
+            pool_use_lifo=True,
+            pool_pre_ping=True,
+            connect_args={"check_same_thread": False, "timeout": 30},
+            insertmanyvalues_page_size=10_000,
+        )
+        _register_sqlite_events(engine)
+    else:
+        engine = create_engine(url, echo=False, insertmanyvalues_page_size=10_000)
+
+    return engine
+
+
+def create_async_db_engine(database_url: str | None = None):
+    """Create the async database engine used by API request handling."""
+    url = database_url or get_async_database_url()
+    engine = create_async_engine(url, echo=False)
+
+    if url.startswith("sqlite"):
+        _register_sqlite_events(engine.sync_engine)
 
     return engine
 
 
-# Global engine and session factory
+# Global engines and session factories
 _engine = None
 _SessionLocal = None
+_async_engine = None
+_AsyncSessionLocal = None
 
 
 def get_engine():
@@ -55,6 +108,22 @@ def get_session_factory():
     return _SessionLocal
 
 
+def get_async_engine():
+    """Get or create the async database engine."""
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = create_async_db_engine()
+    return _async_engine
+
+
+def get_async_session_factory():
+    """Get or create the async session factory."""
+    global _AsyncSessionLocal
+    if _AsyncSessionLocal is None:
+        _AsyncSessionLocal = async_sessionmaker(bind=get_async_engine(), expire_on_commit=False)
+    return _AsyncSessionLocal
+
+
 def init_db():
     """Initialize the database and create tables."""
     config = get_config()
@@ -67,6 +136,12 @@ def init_db():
     engine = get_engine()
     Base.metadata.create_all(engine)
 
+    # create_all never ALTERs existing tables, so the category default
+    # only applies to fresh databases; backfill rows written before the
+    # column became NOT NULL DEFAULT 'ai'
+    with engine.begin() as conn:
+        conn.execute(text("UPDATE summaries SET category = 'ai' WHERE category IS NULL"))
+
     return engine
 
 
@@ -80,6 +155,13 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+async def get_db_async() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency for getting an async database session."""
+    AsyncSessionLocal = get_async_session_factory()
+    async with AsyncSessionLocal() as session:
+        yield session
+
+
 @contextmanager
 def get_db_session() -> Generator[Session, None, None]:
     """Context manager for database sessions."""
@@ -1,6 +1,8 @@
 """FastAPI application and pipeline orchestrator."""
 
-import json
+import asyncio
+import io
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -16,7 +18,7 @@ from .models import ChannelCreate, PollResponse
 from .processors import Deduplicator, Summarizer, TranscriptFetcher
 from .sources import YouTubeSource
 from .storage import Repository
-from .utils import get_logger, save_json, save_text
+from .utils import get_logger, save_json, save_text, utcnow
 
 logger = get_logger(__name__)
 
@@ -130,34 +132,41 @@ def poll_channels(session: Session) -> int:
     channels = repo.get_channels(active_only=True)
     new_videos_total = 0
 
-    with YouTubeSource(timeout=config.settings.transcript_timeout_seconds) as youtube:
-        for channel in channels:
-            try:
-                logger.info(f"Polling channel: {channel.name}")
+    if not channels:
+        return 0
 
-                videos = youtube.poll_channel(
-                    channel.id,
-                    max_videos=config.settings.max_videos_per_poll,
-                )
+    # Fetch all channel feeds concurrently over one pooled HTTP/2
+    # connection; DB writes stay serial below
+    with YouTubeSource(timeout=config.settings.transcript_timeout_seconds) as youtube:
+        feeds = asyncio.run(
+            youtube.poll_channels_async(
+                [channel.id for channel in channels],
+                max_videos=config.settings.max_videos_per_poll,
+            )
+        )
 
-                # Filter out duplicates
-                video_ids = [v.id for v in videos]
-                new_ids = dedup.filter_new_videos(video_ids)
-                new_videos = [v for v in videos if v.id in new_ids]
+    # One transaction (one fsync) for the whole poll's worth of writes
+    with repo.bulk():
+        for channel in channels:
+            videos = feeds.get(channel.id)
+            if videos is None:
+                # Fetch failed; already logged by the source
+                continue
 
-                # Insert new videos
-                for video_info in new_videos:
-                    repo.create_video(video_info)
-                    new_videos_total += 1
+            # Filter out duplicates
+            video_ids = [v.id for v in videos]
+            new_ids = dedup.filter_new_videos(video_ids)
+            new_videos = [v for v in videos if v.id in new_ids]
 
-                # Update channel checked timestamp
-                repo.update_channel_checked(channel.id)
+            # Insert new videos in one statement
+            new_videos_total += repo.bulk_create_videos(new_videos)
+            dedup.mark_known(new_ids)
 
-                if new_videos:
-                    logger.info(f"Found {len(new_videos)} new videos for {channel.name}")
+            # Update channel checked timestamp
+            repo.update_channel_checked(channel.id)
 
-            except Exception as e:
-                logger.error(f"Failed to poll channel {channel.name}: {e}")
+            if new_videos:
+                logger.info(f"Found {len(new_videos)} new videos for {channel.name}")
 
     logger.info(f"Poll complete: {new_videos_total} new videos")
     return new_videos_total
@@ -180,56 +189,60 @@ def process_pending_videos(session: Session) -> tuple[int, int]:
     processed = 0
     errors = 0
 
-    for video in pending:
-        try:
-            logger.info(f"Processing video: {video.title[:50]}...")
+    if not pending:
+        logger.info("Processing complete: 0 processed, 0 errors")
+        return 0, 0
 
-            # Fetch transcript
-            result = transcript_fetcher.fetch(video.id)
+    # Stage 1: fetch transcripts concurrently (I/O-bound)
+    with transcript_fetcher:
+        with ThreadPoolExecutor(max_workers=min(8, len(pending))) as executor:
+            transcript_results = list(
+                executor.map(lambda video: transcript_fetcher.fetch(video.id), pending)
+            )
 
-            if not result.success:
-                logger.warning(f"No transcript for {video.id}: {result.error}")
-                repo.update_video_status(video.id, "no_transcript")
-                errors += 1
-                continue
+    to_summarize = []
+    status_updates = []
+    for video, result in zip(pending, transcript_results):
+        if not result.success:
+            logger.warning(f"No transcript for {video.id}: {result.error}")
+            status_updates.append({"id": video.id, "status": "no_transcript"})
+            errors += 1
+            continue
 
-            # Save transcript to database
-            repo.create_transcript(
-                video_id=video.id,
-                text=result.text,
-                source=result.source,
-                language=result.language,
-            )
+        to_summarize.append((video, result))
 
-            # Generate summary
-            channel_name = video.channel.name if video.channel else "Unknown"
-            summary_result = summarizer.summarize(
-                video_id=video.id,
-                title=video.title,
-                channel=channel_name,
-                transcript=result.text,
-            )
+    # Save all fetched transcripts in one bulk INSERT
+    repo.bulk_create_transcripts([result for _, result in to_summarize])
 
-            if summary_result.success:
-                repo.create_summary(
-                    video_id=video.id,
-                    model=summary_result.model,
-                    summary_text=summary_result.summary,
-                    key_points=summary_result.key_points,
-                    category=summary_result.category,
-                )
-                repo.update_video_status(video.id, "processed")
-                processed += 1
-            else:
-                logger.warning(f"Summary failed for {video.id}: {summary_result.error}")
-                repo.update_video_status(video.id, "failed")
-                errors += 1
-
-        except Exception as e:
-            logger.error(f"Failed to process video {video.id}: {e}")
-            repo.update_video_status(video.id, "failed")
+    # Stage 2: generate summaries with bounded concurrency against Ollama
+    summary_results = summarizer.summarize_batch(
+        [
+            {
+                "video_id": video.id,
+                "title": video.title,
+                "channel": video.channel.name if video.channel else "Unknown",
+                "transcript": result.text,
+            }
+            for video, result in to_summarize
+        ],
+        concurrency=max(1, config.settings.summary_concurrency),
+    )
+
+    # Save all successful summaries in one bulk INSERT, then flip all
+    # statuses with one executemany UPDATE
+    repo.bulk_create_summaries([result for result in summary_results if result.success])
+
+    for (video, _), summary_result in zip(to_summarize, summary_results):
+        if summary_result.success:
+            status_updates.append({"id": video.id, "status": "processed"})
+            processed += 1
+        else:
+            logger.warning(f"Summary failed for {video.id}: {summary_result.error}")
+            status_updates.append({"id": video.id, "status": "failed"})
             errors += 1
 
+    repo.bulk_update_video_statuses(status_updates)
+
     logger.info(f"Processing complete: {processed} processed, {errors} errors")
     return processed, errors
 
@@ -244,39 +257,34 @@ def generate_daily_digest(session: Session) -> Path:
     config = get_config()
     repo = Repository(session)
 
-    since = datetime.utcnow() - timedelta(hours=24)
+    since = utcnow() - timedelta(hours=24)
     videos = repo.get_videos_since(since)
 
+    summaries = repo.get_summaries_for_videos([video.id for video in videos])
+
     digest_videos = []
     for video in videos:
-        summary = repo.get_summary(video.id)
+        summary = summaries.get(video.id)
         if summary:
-            key_points = []
-            if summary.key_points:
-                try:
-                    key_points = json.loads(summary.key_points)
-                except json.JSONDecodeError:
-                    pass
-
             digest_videos.append({
                 "title": video.title,
                 "link": video.url,
                 "channel": video.channel.name if video.channel else "Unknown",
-                "published": video.published_at.isoformat() if video.published_at else None,
+                "published": video.published_at,
                 "summary": summary.summary_text,
-                "key_points": key_points,
-                "category": summary.category or "ai",
+                "key_points": summary.key_points or [],
+                "category": summary.category,
             })
 
     # Sort by channel priority (using published_at as proxy for now)
-    digest_videos.sort(key=lambda x: x.get("published", ""), reverse=True)
+    digest_videos.sort(key=lambda x: x["published"] or datetime.min, reverse=True)
 
-    today = datetime.utcnow().date().isoformat()
+    today = utcnow().date().isoformat()
 
-    # Save JSON digest
+    # Save JSON digest; orjson serializes the datetimes directly
     digest_data = {
         "source": "signal-watch",
-        "generated_at": datetime.utcnow().isoformat(),
+        "generated_at": utcnow(),
         "date": today,
         "videos": digest_videos,
     }
@@ -285,6 +293,9 @@ def generate_daily_digest(session: Session) -> Path:
     json_path = digests_dir / f"digest_{today}.json"
     save_json(digest_data, json_path)
 
+    # Record the newest digest so readers can skip the directory scan
+    (digests_dir / "LATEST").write_text(json_path.name)
+
     # Save markdown digest
     md_content = generate_digest_markdown(digest_data)
     md_path = digests_dir / f"digest_{today}.md"
@@ -300,37 +311,43 @@ def generate_daily_digest(session: Session) -> Path:
 
 def generate_digest_markdown(digest_data: dict) -> str:
     """Generate markdown formatted digest."""
-    lines = [
-        f"# Signal Watch Daily Digest",
-        f"**Date:** {digest_data['date']}",
-        f"**Generated:** {digest_data['generated_at']}",
-        "",
-        "---",
-        "",
-    ]
+    buf = io.StringIO()
+    write = buf.write
+
+    generated_at = digest_data["generated_at"]
+    if isinstance(generated_at, datetime):
+        generated_at = generated_at.isoformat()
+
+    write(
+        f"# Signal Watch Daily Digest\n"
+        f"**Date:** {digest_data['date']}\n"
+        f"**Generated:** {generated_at}\n"
+        "\n---\n\n"
+    )
 
     if not digest_data["videos"]:
-        lines.append("*No new videos in the last 24 hours.*")
-        return "\n".join(lines)
+        write("*No new videos in the last 24 hours.*")
+        return buf.getvalue()
 
     for video in digest_data["videos"]:
-        lines.append(f"## {video['title']}")
-        lines.append(f"**Channel:** {video['channel']} | **Category:** {video['category']}")
-        lines.append(f"**Link:** {video['link']}")
-        lines.append("")
-        lines.append(video["summary"])
-        lines.append("")
+        write(
+            f"## {video['title']}\n"
+            f"**Channel:** {video['channel']} | **Category:** {video['category']}\n"
+            f"**Link:** {video['link']}\n"
+            "\n"
+            f"{video['summary']}\n"
+            "\n"
+        )
 
         if video.get("key_points"):
-            lines.append("**Key Points:**")
-            for point in video["key_points"]:
-                lines.append(f"- {point}")
-            lines.append("")
+            write("**Key Points:**\n")
+            write("\n".join(f"- {point}" for point in video["key_points"]))
+            write("\n\n")
 
-        lines.append("---")
-        lines.append("")
+        write("---\n\n")
 
-    return "\n".join(lines)
+    # Match the trailing-newline behavior of the previous join-based builder
+    return buf.getvalue().rstrip("\n") + "\n"
 
 
 # FastAPI app
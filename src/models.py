@@ -4,9 +4,22 @@ from datetime import datetime
 from typing import Optional
 
 from pydantic import BaseModel, ConfigDict, Field
-from sqlalchemy import Boolean, Column, DateTime, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+)
 from sqlalchemy.orm import DeclarativeBase, relationship
 
+from .utils import utcnow
+
 
 # SQLAlchemy Base
 class Base(DeclarativeBase):
@@ -23,9 +36,9 @@ class ChannelORM(Base):
     name = Column(String, nullable=False)
     url = Column(String, nullable=False)
     domain = Column(String, default="ai")
-    active = Column(Boolean, default=True)
+    active = Column(Boolean, default=True, index=True)
     last_checked_at = Column(DateTime, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=utcnow)
 
     videos = relationship("VideoORM", back_populates="channel")
 
@@ -34,6 +47,14 @@ class VideoORM(Base):
     """YouTube video database model."""
     __tablename__ = "videos"
 
+    # Cover the pipeline's status scans and the per-channel listing
+    # queries, both ordered by recency; created by the idempotent
+    # create_all on startup
+    __table_args__ = (
+        Index("ix_videos_status_published", "status", "published_at"),
+        Index("ix_videos_channel_published", "channel_id", "published_at"),
+    )
+
     id = Column(String, primary_key=True)
     channel_id = Column(String, ForeignKey("channels.id"), nullable=False)
     title = Column(String, nullable=False)
@@ -41,7 +62,7 @@ class VideoORM(Base):
     published_at = Column(DateTime, nullable=True)
     duration_seconds = Column(Integer, nullable=True)
     status = Column(String, default="pending")
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=utcnow)
 
     channel = relationship("ChannelORM", back_populates="videos")
     transcript = relationship("TranscriptORM", back_populates="video", uselist=False)
@@ -57,7 +78,7 @@ class TranscriptORM(Base):
     source = Column(String, nullable=True)
     text = Column(Text, nullable=False)
     language = Column(String, default="en")
-    fetched_at = Column(DateTime, default=datetime.utcnow)
+    fetched_at = Column(DateTime, default=utcnow)
 
     video = relationship("VideoORM", back_populates="transcript")
 
@@ -66,13 +87,18 @@ class SummaryORM(Base):
     """LLM-generated summary database model."""
     __tablename__ = "summaries"
 
+    # Covers latest-summary-per-video lookups
+    __table_args__ = (Index("ix_summaries_video_created", "video_id", "created_at"),)
+
     id = Column(Integer, primary_key=True, autoincrement=True)
     video_id = Column(String, ForeignKey("videos.id"), nullable=False)
     model = Column(String, nullable=False)
     summary_text = Column(Text, nullable=False)
-    key_points = Column(Text, nullable=True)  # JSON array
-    category = Column(String, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    # JSON array; SQLAlchemy (de)serializes, and stored text from the
+    # old json.dumps'd String column reads back unchanged
+    key_points = Column(JSON, nullable=True)
+    category = Column(String, nullable=False, default="ai", server_default="ai")
+    created_at = Column(DateTime, default=utcnow)
 
     video = relationship("VideoORM", back_populates="summaries")
 
@@ -82,7 +108,7 @@ class RunORM(Base):
     __tablename__ = "runs"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    started_at = Column(DateTime, nullable=False)
+    started_at = Column(DateTime, nullable=False, index=True)
     finished_at = Column(DateTime, nullable=True)
     new_videos = Column(Integer, default=0)
     processed = Column(Integer, default=0)
@@ -220,3 +246,15 @@ class HealthResponse(BaseModel):
     version: str
     database: str
     ollama: str
+
+
+def from_orm_fast(cls: type[BaseModel], orm: object, **extra):
+    """
+    Build a response model from a trusted ORM row, skipping validation.
+
+    The row already passed validation on write, so model_construct is
+    safe; extra keyword arguments override or supplement ORM attributes.
+    """
+    values = {name: getattr(orm, name) for name in cls.model_fields if hasattr(orm, name)}
+    values.update(extra)
+    return cls.model_construct(**values)
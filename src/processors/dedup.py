@@ -1,5 +1,7 @@
 """Deduplication logic for videos."""
 
+from pybloom_live import ScalableBloomFilter
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from ..models import VideoORM
@@ -7,12 +9,50 @@ from ..utils import get_logger
 
 logger = get_logger(__name__)
 
+# Keep IN clauses well under SQLite's bound-parameter limit
+_IN_CHUNK_SIZE = 500
+
+# Process-lifetime might-contain prescreen over known video IDs, seeded
+# from the DB once and kept current via mark_known; Deduplicators are
+# constructed per poll cycle, so seeding there would re-scan the whole
+# videos table every cycle. False positives fall through to the SQL
+# check, so dedup stays exact.
+_bloom: ScalableBloomFilter | None = None
+
+
+def _get_bloom(session: Session) -> ScalableBloomFilter:
+    """Get the shared Bloom filter, seeding it on first use."""
+    global _bloom
+    if _bloom is None:
+        bloom = ScalableBloomFilter(initial_capacity=100_000, error_rate=0.001)
+        for video_id in session.execute(select(VideoORM.id)).scalars():
+            bloom.add(video_id)
+        _bloom = bloom
+    return _bloom
+
+
+def reset_bloom_filter() -> None:
+    """Drop the process-wide Bloom filter so the next use re-seeds (for tests)."""
+    global _bloom
+    _bloom = None
+
+
+def add_known(video_id: str) -> None:
+    """Record a video ID inserted outside the poll loop.
+
+    No-op until the filter has been seeded; an unseeded filter picks the
+    ID up from the DB scan on first use.
+    """
+    if _bloom is not None:
+        _bloom.add(video_id)
+
 
 class Deduplicator:
     """Handles deduplication of videos by ID."""
 
     def __init__(self, session: Session):
         self.session = session
+        self._bloom = _get_bloom(session)
 
     def filter_new_videos(self, video_ids: list[str]) -> list[str]:
         """
@@ -27,11 +67,18 @@ class Deduplicator:
         if not video_ids:
             return []
 
-        existing = self.session.query(VideoORM.id).filter(
-            VideoORM.id.in_(video_ids)
-        ).all()
+        # Only IDs the Bloom filter might contain need DB verification
+        maybe_existing = [vid for vid in video_ids if vid in self._bloom]
+
+        existing_ids: set[str] = set()
+        for i in range(0, len(maybe_existing), _IN_CHUNK_SIZE):
+            chunk = maybe_existing[i:i + _IN_CHUNK_SIZE]
+            existing_ids.update(
+                self.session.execute(
+                    select(VideoORM.id).where(VideoORM.id.in_(chunk))
+                ).scalars()
+            )
 
-        existing_ids = {row[0] for row in existing}
         new_ids = [vid for vid in video_ids if vid not in existing_ids]
 
         if existing_ids:
@@ -39,6 +86,11 @@ class Deduplicator:
 
         return new_ids
 
+    def mark_known(self, video_ids: list[str]) -> None:
+        """Record freshly inserted video IDs in the Bloom filter."""
+        for video_id in video_ids:
+            self._bloom.add(video_id)
+
     def is_duplicate(self, video_id: str) -> bool:
         """Check if a video ID already exists."""
-        return self.session.query(VideoORM).filter(VideoORM.id == video_id).first() is not None
+        return not self.filter_new_videos([video_id])
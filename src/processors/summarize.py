@@ -1,19 +1,62 @@
 """LLM summarization using Ollama."""
 
-import json
+import asyncio
+import re
+import time
 from dataclasses import dataclass
-from pathlib import Path
+from functools import lru_cache
 from typing import Optional
 
 import ollama
+import orjson
 
 from ..config import get_config, get_project_root, get_settings
 from ..utils import get_logger, truncate_text
 
 logger = get_logger(__name__)
 
+# Matches a fenced JSON object in an LLM response
+_FENCE_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.S)
 
-@dataclass
+# Fallback prompt if the template file is missing
+_DEFAULT_PROMPT = """Summarize this video transcript. Return JSON with:
+{
+  "summary": "2-3 sentence summary",
+  "key_points": ["point 1", "point 2", "point 3"],
+  "category": "research|announcement|tutorial|news|analysis"
+}
+
+Video: {title}
+Channel: {channel}
+Transcript: {transcript}
+
+Return only valid JSON."""
+
+
+@lru_cache(maxsize=1)
+def _get_client() -> ollama.Client:
+    """Shared Ollama client: one connection pool per process, pointed at
+    the configured host instead of the library default."""
+    return ollama.Client(host=get_settings().ollama_host)
+
+
+@lru_cache(maxsize=1)
+def _get_probe_client() -> ollama.Client:
+    """Ollama client with a short timeout, used only for availability
+    probes so a hung server fails the check quickly instead of hanging."""
+    return ollama.Client(host=get_settings().ollama_host, timeout=5)
+
+
+@lru_cache(maxsize=1)
+def _load_prompt_template() -> str:
+    """Load the summarization prompt template once per process."""
+    prompt_path = get_project_root() / "prompts" / "summarize.md"
+    if prompt_path.exists():
+        return prompt_path.read_text()
+    return _DEFAULT_PROMPT
+
+
+@dataclass(slots=True, frozen=True)
 class SummaryResult:
     """Result of summarization operation."""
     video_id: str
@@ -32,30 +75,65 @@ class Summarizer:
         self.config = get_config()
         self.settings = get_settings()
         self.model = model or self.config.settings.summary_model
-        self.prompt_template = self._load_prompt_template()
-
-    def _load_prompt_template(self) -> str:
-        """Load the summarization prompt template."""
-        prompt_path = get_project_root() / "prompts" / "summarize.md"
-        if prompt_path.exists():
-            with open(prompt_path) as f:
-                return f.read()
-        return self._default_prompt()
-
-    def _default_prompt(self) -> str:
-        """Return default prompt if template file not found."""
-        return """Summarize this video transcript. Return JSON with:
-{
-  "summary": "2-3 sentence summary",
-  "key_points": ["point 1", "point 2", "point 3"],
-  "category": "research|announcement|tutorial|news|analysis"
-}
+        self.prompt_template = _load_prompt_template()
+        self._avail_cache: Optional[tuple[float, bool]] = None
 
-Video: {title}
-Channel: {channel}
-Transcript: {transcript}
+    _GENERATE_OPTIONS = {
+        "temperature": 0.3,
+        "num_predict": 1000,
+    }
 
-Return only valid JSON."""
+    def _build_prompt(
+        self,
+        title: str,
+        channel: str,
+        transcript: str,
+        max_transcript_length: int,
+    ) -> str:
+        """Build the summarization prompt, truncating long transcripts."""
+        if len(transcript) > max_transcript_length:
+            transcript = transcript[:max_transcript_length] + "..."
+            logger.debug(f"Truncated transcript to {max_transcript_length} chars")
+
+        # str.replace instead of .format: no brace scanning of the 15KB
+        # transcript, and literal {...} in the template or transcript
+        # can't break substitution
+        return (
+            self.prompt_template
+            .replace("{title}", title)
+            .replace("{channel}", channel)
+            .replace("{transcript}", transcript)
+        )
+
+    def _failure(self, video_id: str, error: str) -> SummaryResult:
+        """Build a failed SummaryResult."""
+        return SummaryResult(
+            video_id=video_id,
+            summary="",
+            key_points=[],
+            category="",
+            model=self.model,
+            success=False,
+            error=error
+        )
+
+    def _build_result(self, video_id: str, response_text: str) -> SummaryResult:
+        """Parse an LLM response into a SummaryResult."""
+        result = self._parse_response(response_text)
+
+        if result is None:
+            return self._failure(video_id, "Failed to parse LLM response")
+
+        logger.info(f"Generated summary for {video_id}: {truncate_text(result['summary'], 80)}")
+
+        return SummaryResult(
+            video_id=video_id,
+            summary=result["summary"],
+            key_points=result.get("key_points", []),
+            category=result.get("category", "news"),
+            model=self.model,
+            success=True
+        )
 
     def summarize(
         self,
@@ -80,114 +158,141 @@ Return only valid JSON."""
         """
         logger.info(f"Summarizing video: {video_id} ({title[:50]}...)")
 
-        # Truncate transcript if too long
-        if len(transcript) > max_transcript_length:
-            transcript = transcript[:max_transcript_length] + "..."
-            logger.debug(f"Truncated transcript to {max_transcript_length} chars")
-
-        # Build prompt
-        prompt = self.prompt_template.format(
-            title=title,
-            channel=channel,
-            transcript=transcript
-        )
+        prompt = self._build_prompt(title, channel, transcript, max_transcript_length)
 
         try:
             # Call Ollama
-            response = ollama.generate(
+            response = _get_client().generate(
                 model=self.model,
                 prompt=prompt,
-                options={
-                    "temperature": 0.3,
-                    "num_predict": 1000,
-                }
+                format="json",
+                options=self._GENERATE_OPTIONS,
             )
+            return self._build_result(video_id, response.get("response", ""))
 
-            response_text = response.get("response", "")
-            result = self._parse_response(response_text)
+        except ollama.ResponseError as e:
+            logger.error(f"Ollama error for {video_id}: {e}")
+            return self._failure(video_id, f"Ollama error: {e}")
+        except Exception as e:
+            logger.error(f"Summarization failed for {video_id}: {e}")
+            return self._failure(video_id, str(e))
 
-            if result is None:
-                return SummaryResult(
-                    video_id=video_id,
-                    summary="",
-                    key_points=[],
-                    category="",
-                    model=self.model,
-                    success=False,
-                    error="Failed to parse LLM response"
-                )
+    async def _summarize_one(
+        self,
+        client: "ollama.AsyncClient",
+        semaphore: asyncio.Semaphore,
+        video_id: str,
+        title: str,
+        channel: str,
+        transcript: str,
+        max_transcript_length: int = 15000,
+    ) -> SummaryResult:
+        """Summarize one video through a shared async client."""
+        logger.info(f"Summarizing video: {video_id} ({title[:50]}...)")
 
-            logger.info(f"Generated summary for {video_id}: {truncate_text(result['summary'], 80)}")
+        prompt = self._build_prompt(title, channel, transcript, max_transcript_length)
 
-            return SummaryResult(
-                video_id=video_id,
-                summary=result["summary"],
-                key_points=result.get("key_points", []),
-                category=result.get("category", "news"),
-                model=self.model,
-                success=True
-            )
+        try:
+            async with semaphore:
+                response = await client.generate(
+                    model=self.model,
+                    prompt=prompt,
+                    format="json",
+                    options=self._GENERATE_OPTIONS,
+                )
+            return self._build_result(video_id, response.get("response", ""))
 
         except ollama.ResponseError as e:
             logger.error(f"Ollama error for {video_id}: {e}")
-            return SummaryResult(
-                video_id=video_id,
-                summary="",
-                key_points=[],
-                category="",
-                model=self.model,
-                success=False,
-                error=f"Ollama error: {e}"
-            )
+            return self._failure(video_id, f"Ollama error: {e}")
         except Exception as e:
             logger.error(f"Summarization failed for {video_id}: {e}")
-            return SummaryResult(
-                video_id=video_id,
-                summary="",
-                key_points=[],
-                category="",
-                model=self.model,
-                success=False,
-                error=str(e)
+            return self._failure(video_id, str(e))
+
+    async def _gather(self, items: list[dict], concurrency: int) -> list[SummaryResult]:
+        """Run a batch of summarizations with bounded concurrency."""
+        # One AsyncClient (and connection pool) per batch; it can't be
+        # cached across batches because asyncio.run closes the loop its
+        # connections belong to
+        client = ollama.AsyncClient(host=self.settings.ollama_host)
+        semaphore = asyncio.Semaphore(concurrency)
+        return list(
+            await asyncio.gather(
+                *(self._summarize_one(client, semaphore, **item) for item in items)
             )
+        )
+
+    def summarize_batch(self, items: list[dict], concurrency: int = 8) -> list[SummaryResult]:
+        """
+        Summarize a batch of videos with concurrent Ollama requests.
+
+        Args:
+            items: Dicts with the keyword arguments of summarize()
+            concurrency: Maximum in-flight Ollama requests; effective
+                parallelism is also capped by OLLAMA_NUM_PARALLEL on the server
+
+        Returns:
+            SummaryResults in the same order as items
+        """
+        if not items:
+            return []
+        return asyncio.run(self._gather(items, concurrency))
 
     def _parse_response(self, response_text: str) -> Optional[dict]:
         """Parse LLM response into structured data."""
-        try:
-            # Try to extract JSON from response
-            text = response_text.strip()
-
-            # Handle markdown code blocks
-            if "```json" in text:
-                start = text.find("```json") + 7
-                end = text.find("```", start)
-                text = text[start:end].strip()
-            elif "```" in text:
-                start = text.find("```") + 3
-                end = text.find("```", start)
-                text = text[start:end].strip()
-
-            # Find JSON object
-            start_idx = text.find("{")
-            end_idx = text.rfind("}") + 1
+        text = response_text.strip()
 
-            if start_idx >= 0 and end_idx > start_idx:
-                json_str = text[start_idx:end_idx]
-                return json.loads(json_str)
+        # format="json" makes the whole response a JSON object; take the
+        # fast path and only fall back to extraction for odd responses
+        if text.startswith("{"):
+            try:
+                return orjson.loads(text)
+            except orjson.JSONDecodeError:
+                pass
 
-            return None
+        # Prefer a fenced JSON block, otherwise take the outermost braces
+        match = _FENCE_RE.search(text)
+        if match:
+            json_str = match.group(1)
+        else:
+            start_idx = text.find("{")
+            end_idx = text.rfind("}") + 1
+            if start_idx < 0 or end_idx <= start_idx:
+                return None
+            json_str = text[start_idx:end_idx]
 
-        except json.JSONDecodeError as e:
+        try:
+            return orjson.loads(json_str)
+        except orjson.JSONDecodeError as e:
             logger.warning(f"Failed to parse JSON response: {e}")
             return None
 
-    def check_ollama_available(self) -> bool:
-        """Check if Ollama is running and model is available."""
+    # How long a successful availability probe stays valid by default;
+    # callers needing fresher answers (the health route) pass their own ttl
+    _AVAIL_TTL_SECONDS = 30.0
+
+    def check_ollama_available(self, ttl: float | None = None) -> bool:
+        """Check if Ollama is running and model is available (cached)."""
+        if ttl is None:
+            ttl = self._AVAIL_TTL_SECONDS
+        if self._avail_cache is not None:
+            checked_at, available = self._avail_cache
+            if time.monotonic() - checked_at < ttl:
+                return available
+
         try:
-            models = ollama.list()
-            model_names = [m.get("name", "").split(":")[0] for m in models.get("models", [])]
-            target_model = self.model.split(":")[0]
-            return target_model in model_names
+            models = _get_probe_client().list()
+            # ollama 0.4+ exposes the tag as "model"; older clients used "name"
+            model_names = {
+                (m.get("model") or m.get("name", "")).split(":")[0]
+                for m in models.get("models", [])
+            }
+            available = self.model.split(":")[0] in model_names
         except Exception as e:
             logger.warning(f"Ollama not available: {e}")
+            # Don't cache failures; the next call should re-probe
+            self._avail_cache = None
             return False
+
+        self._avail_cache = (time.monotonic(), available)
+        return available
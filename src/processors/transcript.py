@@ -1,6 +1,8 @@
 """Transcript fetching and normalization."""
 
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
@@ -13,12 +15,29 @@ from youtube_transcript_api._errors import (
 )
 
 from ..config import get_config, get_project_root
-from ..utils import get_logger, save_text
+from ..utils import get_logger
 
 logger = get_logger(__name__)
 
+# Compiled once at import; runs on every transcript. One alternation
+# strips [Music]-style tags and collapses whitespace in a single pass.
+_CLEAN_RE = re.compile(r"(\[.*?\])|(\s+)", re.S)
 
-@dataclass
+
+def _clean_sub(match: re.Match) -> str:
+    """Drop bracketed tags, collapse whitespace runs to one space."""
+    return "" if match.group(1) else " "
+
+
+def _segment_text(item) -> str:
+    """Get the text of one segment (snippet object or legacy dict)."""
+    text = getattr(item, "text", None)
+    if text is not None:
+        return text
+    return item.get("text", "")
+
+
+@dataclass(slots=True, frozen=True)
 class TranscriptResult:
     """Result of transcript fetch operation."""
     video_id: str
@@ -37,6 +56,9 @@ class TranscriptFetcher:
         self.config = get_config()
         self.transcripts_dir = get_project_root() / self.config.storage.transcripts_dir
 
+        # Small pool so transcript writes don't block fetching
+        self._io_pool = ThreadPoolExecutor(max_workers=2)
+
     def fetch(self, video_id: str) -> TranscriptResult:
         """
         Fetch transcript for a YouTube video.
@@ -130,29 +152,42 @@ class TranscriptFetcher:
                 error=str(e)
             )
 
-    def _normalize_transcript(self, transcript_data: list[dict]) -> str:
+    def _normalize_transcript(self, transcript_data) -> str:
         """
         Normalize transcript data into clean text.
 
         Args:
-            transcript_data: List of transcript segments from YouTube API
+            transcript_data: Iterable of transcript segments from YouTube API
 
         Returns:
             Normalized text string
         """
-        # Extract text from segments
-        segments = [item.get("text", "") for item in transcript_data]
-        text = " ".join(segments)
-
-        # Clean up the text
-        text = re.sub(r"\s+", " ", text)  # Normalize whitespace
-        text = re.sub(r"\[.*?\]", "", text)  # Remove [Music], [Applause], etc.
-        text = text.strip()
-
-        return text
+        # Join segment texts lazily, then clean up in a single pass
+        text = " ".join(_segment_text(item) for item in transcript_data)
+        return _CLEAN_RE.sub(_clean_sub, text).strip()
 
     def _save_transcript(self, video_id: str, text: str) -> None:
-        """Save transcript to file."""
+        """Queue a transcript write on the I/O pool."""
         filepath = self.transcripts_dir / f"{video_id}.txt"
-        save_text(text, filepath)
-        logger.debug(f"Saved transcript to {filepath}")
+        self._io_pool.submit(self._write_bytes, filepath, text.encode("utf-8"))
+        logger.debug(f"Queued transcript write to {filepath}")
+
+    @staticmethod
+    def _write_bytes(filepath: Path, data: bytes) -> None:
+        """Write bytes straight to an fd, skipping text-mode re-encoding."""
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+
+    def close(self) -> None:
+        """Flush pending transcript writes and shut down the I/O pool."""
+        self._io_pool.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -1,18 +1,30 @@
 """YouTube channel polling and video discovery."""
 
+import asyncio
 import re
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
-import feedparser
 import httpx
-from dateutil import parser as date_parser
+from lxml import etree
 
 from ..utils import get_logger
 
 logger = get_logger(__name__)
 
+# YouTube channel feeds are Atom documents with a small fixed schema
+_ATOM_NS = {
+    "a": "http://www.w3.org/2005/Atom",
+    "yt": "http://www.youtube.com/xml/schemas/2015",
+}
+
+# Compiled once at import; tried in order when extracting video IDs
+_ID_PATTERNS = (
+    re.compile(r"(?:v=|/v/|youtu\.be/)([a-zA-Z0-9_-]{11})"),
+    re.compile(r"(?:embed/)([a-zA-Z0-9_-]{11})"),
+)
+
 
 @dataclass
 class VideoInfo:
@@ -32,7 +44,16 @@ class YouTubeSource:
 
     def __init__(self, timeout: int = 30):
         self.timeout = timeout
-        self.client = httpx.Client(timeout=timeout)
+        self.client = httpx.Client(**self._client_kwargs())
+
+    def _client_kwargs(self) -> dict:
+        """Shared httpx client configuration."""
+        return {
+            "http2": True,
+            "timeout": self.timeout,
+            "limits": httpx.Limits(max_keepalive_connections=20, max_connections=50),
+            "headers": {"Accept-Encoding": "gzip"},
+        }
 
     def get_channel_feed_url(self, channel_id: str) -> str:
         """Get RSS feed URL for a channel."""
@@ -59,14 +80,59 @@ class YouTubeSource:
             logger.error(f"Failed to fetch channel feed {channel_id}: {e}")
             return []
 
-        feed = feedparser.parse(response.text)
+        return self._parse_feed(response.content, channel_id, max_videos)
+
+    async def poll_channels_async(
+        self, channel_ids: list[str], max_videos: int = 10
+    ) -> dict[str, list[VideoInfo]]:
+        """
+        Poll many channel feeds concurrently.
+
+        Args:
+            channel_ids: YouTube channel IDs
+            max_videos: Maximum number of videos per channel
 
-        if not feed.entries:
+        Returns:
+            Mapping of channel ID to discovered videos; channels whose
+            fetch failed are omitted (and logged)
+        """
+        async with httpx.AsyncClient(**self._client_kwargs()) as client:
+            responses = await asyncio.gather(
+                *(client.get(self.get_channel_feed_url(cid)) for cid in channel_ids),
+                return_exceptions=True,
+            )
+
+        results = {}
+        for channel_id, response in zip(channel_ids, responses):
+            if isinstance(response, Exception):
+                logger.error(f"Failed to fetch channel feed {channel_id}: {response}")
+                continue
+
+            try:
+                response.raise_for_status()
+            except httpx.HTTPError as e:
+                logger.error(f"Failed to fetch channel feed {channel_id}: {e}")
+                continue
+
+            results[channel_id] = self._parse_feed(response.content, channel_id, max_videos)
+
+        return results
+
+    def _parse_feed(self, feed_content: bytes, channel_id: str, max_videos: int) -> list[VideoInfo]:
+        """Parse a channel feed document into VideoInfo objects."""
+        try:
+            root = etree.fromstring(feed_content)
+        except etree.XMLSyntaxError as e:
+            logger.error(f"Invalid feed XML for channel {channel_id}: {e}")
+            return []
+
+        entries = root.findall("a:entry", _ATOM_NS)
+        if not entries:
             logger.info(f"No videos found for channel {channel_id}")
             return []
 
         videos = []
-        for entry in feed.entries[:max_videos]:
+        for entry in entries[:max_videos]:
             video = self._parse_entry(entry, channel_id)
             if video:
                 videos.append(video)
@@ -74,24 +140,31 @@ class YouTubeSource:
         logger.info(f"Found {len(videos)} videos for channel {channel_id}")
         return videos
 
-    def _parse_entry(self, entry: dict, channel_id: str) -> Optional[VideoInfo]:
-        """Parse a feed entry into VideoInfo."""
+    def _parse_entry(self, entry: etree._Element, channel_id: str) -> Optional[VideoInfo]:
+        """Parse an Atom feed entry into VideoInfo."""
         try:
-            video_id = entry.get("yt_videoid") or self._extract_video_id(entry.get("link", ""))
+            video_id = entry.findtext("yt:videoId", namespaces=_ATOM_NS)
+            if not video_id:
+                link = entry.find("a:link", _ATOM_NS)
+                if link is not None:
+                    video_id = self._extract_video_id(link.get("href", ""))
             if not video_id:
                 return None
 
             published_at = None
-            if entry.get("published"):
+            published = entry.findtext("a:published", namespaces=_ATOM_NS)
+            if published:
+                # YouTube timestamps are strict RFC 3339; fromisoformat
+                # parses them in C without dateutil's heuristics
                 try:
-                    published_at = date_parser.parse(entry["published"])
-                except (ValueError, TypeError):
+                    published_at = datetime.fromisoformat(published.replace("Z", "+00:00"))
+                except ValueError:
                     pass
 
             return VideoInfo(
                 id=video_id,
                 channel_id=channel_id,
-                title=entry.get("title", "Unknown Title"),
+                title=entry.findtext("a:title", namespaces=_ATOM_NS) or "Unknown Title",
                 url=f"https://www.youtube.com/watch?v={video_id}",
                 published_at=published_at,
                 duration_seconds=None,  # RSS doesn't include duration
@@ -102,12 +175,8 @@ class YouTubeSource:
 
     def _extract_video_id(self, url: str) -> Optional[str]:
         """Extract video ID from YouTube URL."""
-        patterns = [
-            r"(?:v=|/v/|youtu\.be/)([a-zA-Z0-9_-]{11})",
-            r"(?:embed/)([a-zA-Z0-9_-]{11})",
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, url)
+        for pattern in _ID_PATTERNS:
+            match = pattern.search(url)
             if match:
                 return match.group(1)
         return None
@@ -1,11 +1,13 @@
 """Repository for CRUD operations."""
 
-import json
+import time
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Iterator, Optional
 
-from sqlalchemy import desc, func
-from sqlalchemy.orm import Session
+from sqlalchemy import Row, bindparam, desc, func, insert, lambda_stmt, select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session, selectinload
 
 from ..models import (
     ChannelCreate,
@@ -15,11 +17,49 @@ from ..models import (
     TranscriptORM,
     VideoORM,
 )
+from ..processors.dedup import add_known
+from ..processors.summarize import SummaryResult
+from ..processors.transcript import TranscriptResult
 from ..sources.youtube import VideoInfo
-from ..utils import get_logger
+from ..utils import get_logger, utcnow
 
 logger = get_logger(__name__)
 
+# Stats are polled by dashboards every few seconds while the counts only
+# change when the pipeline writes; cache the dict briefly at module scope
+# since Repository instances are per-request
+_STATS_TTL_SECONDS = 10.0
+_stats_cache: Optional[tuple[float, dict]] = None
+
+
+def _invalidate_stats_cache() -> None:
+    """Drop the cached stats after a write that changes the counts."""
+    global _stats_cache
+    _stats_cache = None
+
+
+def reset_stats_cache() -> None:
+    """Clear the cached stats (for tests)."""
+    _invalidate_stats_cache()
+
+
+# Compile-once statements for the hot single-row getters; lambda_stmt
+# caches the generated SQL instead of rebuilding it per call
+_GET_CHANNEL = lambda_stmt(lambda: select(ChannelORM).where(ChannelORM.id == bindparam("id")))
+_GET_VIDEO = lambda_stmt(lambda: select(VideoORM).where(VideoORM.id == bindparam("id")))
+_GET_TRANSCRIPT = lambda_stmt(
+    lambda: select(TranscriptORM).where(TranscriptORM.video_id == bindparam("id"))
+)
+_GET_SUMMARY = lambda_stmt(
+    lambda: select(SummaryORM)
+    .where(SummaryORM.video_id == bindparam("id"))
+    .order_by(desc(SummaryORM.created_at))
+    .limit(1)
+)
+_GET_LATEST_RUN = lambda_stmt(
+    lambda: select(RunORM).order_by(desc(RunORM.started_at)).limit(1)
+)
+
 
 class Repository:
     """Repository for database operations."""
@@ -27,17 +67,35 @@ class Repository:
     def __init__(self, session: Session):
         self.session = session
 
+    def _commit(self) -> None:
+        """Commit, unless a bulk() block is deferring to one commit."""
+        if self.session.in_nested_transaction():
+            return
+        self.session.commit()
+
+    @contextmanager
+    def bulk(self):
+        """Batch many writes into a single transaction.
+
+        Inside the block the create/update methods skip their per-call
+        commits; everything lands with one commit (one fsync on SQLite)
+        when the block exits.
+        """
+        with self.session.begin_nested():
+            yield self
+        self.session.commit()
+
     # Channel operations
     def get_channels(self, active_only: bool = False) -> list[ChannelORM]:
         """Get all channels."""
         query = self.session.query(ChannelORM)
         if active_only:
-            query = query.filter(ChannelORM.active == True)
+            query = query.filter(ChannelORM.active.is_(True))
         return query.all()
 
     def get_channel(self, channel_id: str) -> Optional[ChannelORM]:
         """Get a channel by ID."""
-        return self.session.query(ChannelORM).filter(ChannelORM.id == channel_id).first()
+        return self.session.scalars(_GET_CHANNEL, {"id": channel_id}).first()
 
     def create_channel(self, channel: ChannelCreate) -> ChannelORM:
         """Create a new channel."""
@@ -49,17 +107,19 @@ class Repository:
             active=True,
         )
         self.session.add(db_channel)
-        self.session.commit()
-        self.session.refresh(db_channel)
+        self._commit()
+        _invalidate_stats_cache()
         logger.info(f"Created channel: {channel.name} ({channel.id})")
         return db_channel
 
     def update_channel_checked(self, channel_id: str) -> None:
         """Update channel's last_checked_at timestamp."""
-        channel = self.get_channel(channel_id)
-        if channel:
-            channel.last_checked_at = datetime.utcnow()
-            self.session.commit()
+        self.session.execute(
+            update(ChannelORM)
+            .where(ChannelORM.id == channel_id)
+            .values(last_checked_at=utcnow())
+        )
+        self._commit()
 
     # Video operations
     def get_videos(
@@ -68,9 +128,16 @@ class Repository:
         channel_id: Optional[str] = None,
         limit: int = 50,
         offset: int = 0,
+        with_channel: bool = True,
     ) -> list[VideoORM]:
-        """Get videos with optional filtering."""
+        """Get videos with optional filtering.
+
+        with_channel eagerly loads the channel relationship in one extra
+        query; pass False when the caller never touches video.channel.
+        """
         query = self.session.query(VideoORM)
+        if with_channel:
+            query = query.options(selectinload(VideoORM.channel))
 
         if status:
             query = query.filter(VideoORM.status == status)
@@ -82,7 +149,7 @@ class Repository:
 
     def get_video(self, video_id: str) -> Optional[VideoORM]:
         """Get a video by ID."""
-        return self.session.query(VideoORM).filter(VideoORM.id == video_id).first()
+        return self.session.scalars(_GET_VIDEO, {"id": video_id}).first()
 
     def create_video(self, video_info: VideoInfo) -> VideoORM:
         """Create a new video."""
@@ -96,40 +163,111 @@ class Repository:
             status="pending",
         )
         self.session.add(db_video)
-        self.session.commit()
-        self.session.refresh(db_video)
+        self._commit()
+        _invalidate_stats_cache()
+        # Keep the dedup prescreen in sync with out-of-poll inserts
+        add_known(video_info.id)
         logger.debug(f"Created video: {video_info.title[:50]}...")
         return db_video
 
-    def update_video_status(self, video_id: str, status: str) -> None:
-        """Update a video's status."""
-        video = self.get_video(video_id)
-        if video:
-            video.status = status
-            self.session.commit()
+    def bulk_create_videos(self, video_infos: list[VideoInfo]) -> int:
+        """Insert a batch of new videos with a single bulk INSERT."""
+        if not video_infos:
+            return 0
+
+        rows = [
+            {
+                "id": info.id,
+                "channel_id": info.channel_id,
+                "title": info.title,
+                "url": info.url,
+                "published_at": info.published_at,
+                "duration_seconds": info.duration_seconds,
+                "status": "pending",
+            }
+            for info in video_infos
+        ]
+        # ON CONFLICT DO NOTHING: the Bloom prescreen can miss IDs
+        # written by another process, and a collision here would roll
+        # back the whole poll transaction
+        result = self.session.execute(
+            sqlite_insert(VideoORM)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=["id"])
+        )
+        self._commit()
+        _invalidate_stats_cache()
+        inserted = result.rowcount
+        if inserted < len(rows):
+            logger.debug(f"Skipped {len(rows) - inserted} already-known videos")
+        logger.debug(f"Bulk inserted {inserted} videos")
+        return inserted
+
+    def update_video_status(self, video_id: str, status: str) -> int:
+        """Update a video's status. Returns the number of rows matched."""
+        result = self.session.execute(
+            update(VideoORM).where(VideoORM.id == video_id).values(status=status)
+        )
+        self._commit()
+        if result.rowcount:
+            _invalidate_stats_cache()
+        return result.rowcount
+
+    def bulk_update_video_statuses(self, updates: list[dict]) -> None:
+        """Apply many status flips in one executemany UPDATE by primary key.
+
+        Each dict carries the video "id" and its new "status".
+        """
+        if not updates:
+            return
+
+        self.session.execute(update(VideoORM), updates)
+        self._commit()
+        _invalidate_stats_cache()
+        logger.debug(f"Bulk updated {len(updates)} video statuses")
 
     def get_pending_videos(self, limit: int = 10) -> list[VideoORM]:
         """Get pending videos for processing."""
         return self.get_videos(status="pending", limit=limit)
 
-    def get_videos_since(self, since: datetime) -> list[VideoORM]:
-        """Get videos published since a given datetime."""
-        return (
-            self.session.query(VideoORM)
+    def iter_videos_since(
+        self, since: datetime, with_channel: bool = True
+    ) -> Iterator[VideoORM]:
+        """Stream videos published since a given datetime.
+
+        Materializes rows in batches of 500 (selectinload batches the
+        channel loads the same way) so wide date ranges stay bounded in
+        memory.
+        """
+        query = self.session.query(VideoORM)
+        if with_channel:
+            query = query.options(selectinload(VideoORM.channel))
+        yield from (
+            query
             .filter(VideoORM.published_at >= since)
             .filter(VideoORM.status == "processed")
             .order_by(desc(VideoORM.published_at))
-            .all()
+            .yield_per(500)
         )
 
+    def get_videos_since(self, since: datetime, with_channel: bool = True) -> list[VideoORM]:
+        """Get videos published since a given datetime."""
+        return list(self.iter_videos_since(since, with_channel=with_channel))
+
     # Transcript operations
     def get_transcript(self, video_id: str) -> Optional[TranscriptORM]:
         """Get transcript for a video."""
-        return (
-            self.session.query(TranscriptORM)
-            .filter(TranscriptORM.video_id == video_id)
-            .first()
-        )
+        return self.session.scalars(_GET_TRANSCRIPT, {"id": video_id}).first()
+
+    def get_transcripts_for_videos(self, video_ids: list[str]) -> dict[str, TranscriptORM]:
+        """Get the transcript for each of the given videos in one query."""
+        if not video_ids:
+            return {}
+
+        rows = self.session.execute(
+            select(TranscriptORM).where(TranscriptORM.video_id.in_(video_ids))
+        ).scalars()
+        return {transcript.video_id: transcript for transcript in rows}
 
     def create_transcript(
         self,
@@ -146,20 +284,50 @@ class Repository:
             language=language,
         )
         self.session.add(db_transcript)
-        self.session.commit()
-        self.session.refresh(db_transcript)
+        self._commit()
+        _invalidate_stats_cache()
         logger.debug(f"Saved transcript for video: {video_id}")
         return db_transcript
 
+    def bulk_create_transcripts(self, results: list[TranscriptResult]) -> int:
+        """Insert a batch of fetched transcripts with a single bulk INSERT."""
+        rows = [
+            {
+                "video_id": result.video_id,
+                "text": result.text,
+                "source": result.source,
+                "language": result.language,
+            }
+            for result in results
+            if result.success
+        ]
+        if not rows:
+            return 0
+
+        self.session.execute(insert(TranscriptORM), rows)
+        self._commit()
+        _invalidate_stats_cache()
+        logger.debug(f"Bulk inserted {len(rows)} transcripts")
+        return len(rows)
+
     # Summary operations
     def get_summary(self, video_id: str) -> Optional[SummaryORM]:
         """Get the latest summary for a video."""
-        return (
-            self.session.query(SummaryORM)
-            .filter(SummaryORM.video_id == video_id)
-            .order_by(desc(SummaryORM.created_at))
-            .first()
-        )
+        return self.session.scalars(_GET_SUMMARY, {"id": video_id}).first()
+
+    def get_summaries_for_videos(self, video_ids: list[str]) -> dict[str, SummaryORM]:
+        """Get the latest summary for each of the given videos in one query."""
+        if not video_ids:
+            return {}
+
+        rows = self.session.execute(
+            select(SummaryORM)
+            .where(SummaryORM.video_id.in_(video_ids))
+            .order_by(SummaryORM.created_at)
+        ).scalars()
+
+        # Later summaries overwrite earlier ones, leaving the latest per video
+        return {summary.video_id: summary for summary in rows}
 
     def create_summary(
         self,
@@ -167,31 +335,55 @@ class Repository:
         model: str,
         summary_text: str,
         key_points: list[str],
-        category: str = "",
+        category: str = "ai",
     ) -> SummaryORM:
         """Create a summary record."""
         db_summary = SummaryORM(
             video_id=video_id,
             model=model,
             summary_text=summary_text,
-            key_points=json.dumps(key_points),
-            category=category,
+            key_points=key_points,
+            category=category or "ai",
         )
         self.session.add(db_summary)
-        self.session.commit()
-        self.session.refresh(db_summary)
+        self._commit()
+        _invalidate_stats_cache()
         logger.debug(f"Saved summary for video: {video_id}")
         return db_summary
 
+    def bulk_create_summaries(self, results: list[SummaryResult]) -> int:
+        """Insert a batch of generated summaries with a single bulk INSERT."""
+        rows = [
+            {
+                "video_id": result.video_id,
+                "model": result.model,
+                "summary_text": result.summary,
+                "key_points": result.key_points,
+                "category": result.category or "ai",
+            }
+            for result in results
+            if result.success
+        ]
+        if not rows:
+            return 0
+
+        self.session.execute(insert(SummaryORM), rows)
+        self._commit()
+        _invalidate_stats_cache()
+        logger.debug(f"Bulk inserted {len(rows)} summaries")
+        return len(rows)
+
     # Run operations
-    def create_run(self) -> RunORM:
-        """Create a new pipeline run."""
-        db_run = RunORM(started_at=datetime.utcnow())
-        self.session.add(db_run)
-        self.session.commit()
-        self.session.refresh(db_run)
-        logger.info(f"Started pipeline run: {db_run.id}")
-        return db_run
+    def create_run(self) -> Row:
+        """Create a new pipeline run in a single INSERT ... RETURNING."""
+        run = self.session.execute(
+            insert(RunORM)
+            .values(started_at=utcnow())
+            .returning(RunORM.id, RunORM.started_at)
+        ).one()
+        self._commit()
+        logger.info(f"Started pipeline run: {run.id}")
+        return run
 
     def complete_run(
         self,
@@ -204,13 +396,13 @@ class Repository:
         """Complete a pipeline run."""
         run = self.session.query(RunORM).filter(RunORM.id == run_id).first()
         if run:
-            run.finished_at = datetime.utcnow()
+            run.finished_at = utcnow()
             run.new_videos = new_videos
             run.processed = processed
             run.errors = errors
             run.status = status
             run.runtime_seconds = (run.finished_at - run.started_at).total_seconds()
-            self.session.commit()
+            self._commit()
             logger.info(
                 f"Completed run {run_id}: {new_videos} new, {processed} processed, {errors} errors"
             )
@@ -226,43 +418,39 @@ class Repository:
 
     def get_latest_run(self) -> Optional[RunORM]:
         """Get the most recent pipeline run."""
-        return self.session.query(RunORM).order_by(desc(RunORM.started_at)).first()
+        return self.session.scalars(_GET_LATEST_RUN).first()
 
     # Statistics
     def get_stats(self) -> dict:
-        """Get database statistics."""
-        total_channels = self.session.query(func.count(ChannelORM.id)).scalar() or 0
-        active_channels = (
-            self.session.query(func.count(ChannelORM.id))
-            .filter(ChannelORM.active == True)
-            .scalar()
-            or 0
-        )
-        total_videos = self.session.query(func.count(VideoORM.id)).scalar() or 0
-        processed_videos = (
-            self.session.query(func.count(VideoORM.id))
-            .filter(VideoORM.status == "processed")
-            .scalar()
-            or 0
-        )
-        pending_videos = (
-            self.session.query(func.count(VideoORM.id))
-            .filter(VideoORM.status == "pending")
-            .scalar()
-            or 0
-        )
-        failed_videos = (
-            self.session.query(func.count(VideoORM.id))
-            .filter(VideoORM.status.in_(["failed", "no_transcript"]))
-            .scalar()
-            or 0
-        )
-        total_transcripts = (
-            self.session.query(func.count(TranscriptORM.id)).scalar() or 0
+        """Get database statistics with conditional aggregation (cached briefly)."""
+        global _stats_cache
+
+        if _stats_cache is not None:
+            computed_at, stats = _stats_cache
+            if time.monotonic() - computed_at < _STATS_TTL_SECONDS:
+                return stats
+
+        total_channels, active_channels = self.session.query(
+            func.count(ChannelORM.id),
+            func.count(ChannelORM.id).filter(ChannelORM.active.is_(True)),
+        ).one()
+
+        status_counts = dict(
+            self.session.query(VideoORM.status, func.count(VideoORM.id))
+            .group_by(VideoORM.status)
+            .all()
         )
-        total_summaries = self.session.query(func.count(SummaryORM.id)).scalar() or 0
+        total_videos = sum(status_counts.values())
+        processed_videos = status_counts.get("processed", 0)
+        pending_videos = status_counts.get("pending", 0)
+        failed_videos = status_counts.get("failed", 0) + status_counts.get("no_transcript", 0)
+
+        total_transcripts, total_summaries = self.session.query(
+            select(func.count(TranscriptORM.id)).scalar_subquery(),
+            select(func.count(SummaryORM.id)).scalar_subquery(),
+        ).one()
 
-        return {
+        stats = {
             "total_channels": total_channels,
             "active_channels": active_channels,
             "total_videos": total_videos,
@@ -272,3 +460,5 @@ class Repository:
             "total_transcripts": total_transcripts,
             "total_summaries": total_summaries,
         }
+        _stats_cache = (time.monotonic(), stats)
+        return stats
@@ -1,23 +1,48 @@
 """Shared utilities for Signal Watch."""
 
-import json
+import atexit
 import logging
+import queue
 import sys
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
 from pathlib import Path
 
+import orjson
+
 from .config import get_project_root
 
 
-def setup_logging(name: str = "signal_watch", level: str = "INFO") -> logging.Logger:
-    """Set up logging with file and console handlers."""
-    logger = logging.getLogger(name)
-    logger.setLevel(getattr(logging, level.upper()))
+def utcnow() -> datetime:
+    """Naive UTC timestamp, matching what the DB columns store.
+
+    datetime.now(timezone.utc) takes the fast C path and, unlike
+    datetime.utcnow(), is not deprecated on 3.12+.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+# Parent logger every module logger hangs off of; its handlers are
+# attached exactly once and shared through propagation
+_LOG_ROOT = "signal_watch"
+_log_configured = False
 
-    # Avoid duplicate handlers
-    if logger.handlers:
+
+def setup_logging(level: str = "INFO") -> logging.Logger:
+    """Attach console and file handlers to the app's parent logger once.
+
+    Records go through a queue: the calling thread only enqueues, and a
+    background listener thread does the console/disk I/O.
+    """
+    global _log_configured
+
+    logger = logging.getLogger(_LOG_ROOT)
+    if _log_configured:
         return logger
 
+    logger.setLevel(getattr(logging, level.upper()))
+
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.INFO)
@@ -26,14 +51,18 @@ def setup_logging(name: str = "signal_watch", level: str = "INFO") -> logging.Lo
         datefmt="%Y-%m-%d %H:%M:%S"
     )
     console_handler.setFormatter(console_format)
-    logger.addHandler(console_handler)
 
-    # File handler
+    # Rotating file handler, so a long-running process rolls over at
+    # midnight instead of writing to a stale dated filename; delay=True
+    # postpones opening the file (and creating the directory) until the
+    # first record is written
     log_dir = get_project_root() / "data" / "logs"
-    log_dir.mkdir(parents=True, exist_ok=True)
 
-    file_handler = logging.FileHandler(
-        log_dir / f"signal_watch_{datetime.now().strftime('%Y%m%d')}.log"
+    file_handler = _MkdirTimedRotatingFileHandler(
+        log_dir / "signal_watch.log",
+        when="midnight",
+        backupCount=14,
+        delay=True,
     )
     file_handler.setLevel(logging.DEBUG)
     file_format = logging.Formatter(
@@ -41,29 +70,53 @@ def setup_logging(name: str = "signal_watch", level: str = "INFO") -> logging.Lo
         datefmt="%Y-%m-%d %H:%M:%S"
     )
     file_handler.setFormatter(file_format)
-    logger.addHandler(file_handler)
 
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    logger.addHandler(QueueHandler(log_queue))
+
+    listener = QueueListener(
+        log_queue, console_handler, file_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+
+    _log_configured = True
     return logger
 
 
-def get_logger(name: str = "signal_watch") -> logging.Logger:
-    """Get or create a logger."""
-    return setup_logging(name)
+class _MkdirTimedRotatingFileHandler(TimedRotatingFileHandler):
+    """TimedRotatingFileHandler that creates the log directory on first open."""
+
+    def _open(self):
+        Path(self.baseFilename).parent.mkdir(parents=True, exist_ok=True)
+        return super()._open()
+
+
+def get_logger(name: str = _LOG_ROOT) -> logging.Logger:
+    """Get a logger reporting through the shared app handlers."""
+    setup_logging()
+    if name == _LOG_ROOT:
+        return logging.getLogger(_LOG_ROOT)
+    return logging.getLogger(f"{_LOG_ROOT}.{name}")
 
 
 def save_json(data: dict, filepath: Path) -> None:
     """Save data as JSON file."""
     filepath.parent.mkdir(parents=True, exist_ok=True)
-    with open(filepath, "w") as f:
-        json.dump(data, f, indent=2, default=str)
+    filepath.write_bytes(
+        orjson.dumps(
+            data,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NAIVE_UTC,
+            default=str,
+        )
+    )
 
 
 def load_json(filepath: Path) -> dict | None:
     """Load data from JSON file."""
     if not filepath.exists():
         return None
-    with open(filepath) as f:
-        return json.load(f)
+    return orjson.loads(filepath.read_bytes())
 
 
 def save_text(text: str, filepath: Path) -> None:
@@ -81,6 +134,9 @@ def load_text(filepath: Path) -> str | None:
         return f.read()
 
 
+# Durations repeat heavily across digests and dashboards, so cache the
+# formatted strings; None hits the cache like any other key
+@lru_cache(maxsize=4096)
 def format_duration(seconds: int | None) -> str:
     """Format duration in seconds to human-readable string."""
     if seconds is None:
@@ -99,16 +155,18 @@ def format_duration(seconds: int | None) -> str:
 
 def truncate_text(text: str, max_length: int = 100) -> str:
     """Truncate text to max length with ellipsis."""
-    if len(text) <= max_length:
-        return text
-    return text[:max_length - 3] + "..."
+    return text if len(text) <= max_length else f"{text[:max_length - 3]}..."
 
 
+# URL builders are pure functions of short IDs repeated across renders,
+# so cache and reuse the built strings
+@lru_cache(maxsize=16384)
 def youtube_video_url(video_id: str) -> str:
     """Generate YouTube video URL from ID."""
     return f"https://www.youtube.com/watch?v={video_id}"
 
 
+@lru_cache(maxsize=16384)
 def youtube_channel_url(channel_id: str) -> str:
     """Generate YouTube channel URL from ID."""
     return f"https://www.youtube.com/channel/{channel_id}"
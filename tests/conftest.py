@@ -1,31 +1,54 @@
 """Pytest configuration and fixtures."""
 
 import pytest
-from pathlib import Path
-import tempfile
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 
 from src.models import Base
 
 
-@pytest.fixture
-def temp_db():
-    """Create a temporary SQLite database for testing."""
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        db_path = f.name
+@pytest.fixture(scope="session")
+def db_engine():
+    """Shared in-memory engine; the schema is created once per session."""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    # pysqlite commits implicitly around DML, which breaks SAVEPOINTs;
+    # take over transaction control so the per-test rollback works
+    @event.listens_for(engine, "connect")
+    def _disable_implicit_begin(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
 
-    engine = create_engine(f"sqlite:///{db_path}")
     Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def temp_db(db_engine):
+    """Session wrapped in a transaction that rolls back after each test.
 
-    SessionLocal = sessionmaker(bind=engine)
-    session = SessionLocal()
+    Commits inside a test only release a SAVEPOINT, so tests stay
+    isolated without re-running DDL or touching tempfiles.
+    """
+    connection = db_engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
 
     yield session
 
     session.close()
-    Path(db_path).unlink(missing_ok=True)
+    transaction.rollback()
+    connection.close()
 
 
 @pytest.fixture
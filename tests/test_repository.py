@@ -0,0 +1,85 @@
+"""Tests for the repository layer."""
+
+import pytest
+from sqlalchemy import event
+
+from src.models import ChannelORM, VideoORM
+from src.storage import Repository
+from src.storage.repository import reset_stats_cache
+
+
+@pytest.fixture(autouse=True)
+def _fresh_stats_cache():
+    """Isolate the module-level stats cache between tests."""
+    reset_stats_cache()
+    yield
+    reset_stats_cache()
+
+
+@pytest.fixture
+def populated_db(temp_db):
+    """Database session with a couple of channels and videos."""
+    temp_db.add_all([
+        ChannelORM(id="chan1", name="Channel One", url="u1", active=True),
+        ChannelORM(id="chan2", name="Channel Two", url="u2", active=False),
+    ])
+    temp_db.add_all([
+        VideoORM(id="v1", channel_id="chan1", title="t1", url="u", status="processed"),
+        VideoORM(id="v2", channel_id="chan1", title="t2", url="u", status="pending"),
+        VideoORM(id="v3", channel_id="chan2", title="t3", url="u", status="failed"),
+        VideoORM(id="v4", channel_id="chan2", title="t4", url="u", status="no_transcript"),
+    ])
+    temp_db.commit()
+    return temp_db
+
+
+class TestGetStats:
+    """Tests for Repository.get_stats."""
+
+    def test_get_stats_counts(self, populated_db):
+        """Test that stats aggregate channels and video statuses."""
+        stats = Repository(populated_db).get_stats()
+        assert stats["total_channels"] == 2
+        assert stats["active_channels"] == 1
+        assert stats["total_videos"] == 4
+        assert stats["processed_videos"] == 1
+        assert stats["pending_videos"] == 1
+        assert stats["failed_videos"] == 2
+        assert stats["total_transcripts"] == 0
+        assert stats["total_summaries"] == 0
+
+    def test_get_stats_empty(self, temp_db):
+        """Test stats on an empty database."""
+        stats = Repository(temp_db).get_stats()
+        assert stats["total_channels"] == 0
+        assert stats["active_channels"] == 0
+        assert stats["total_videos"] == 0
+
+    def test_get_stats_query_count(self, populated_db):
+        """Test that stats run in at most three queries."""
+        statements = []
+
+        def count_statement(conn, cursor, statement, parameters, context, executemany):
+            # Ignore the transactional bookkeeping of the test fixture
+            if not statement.startswith(("SAVEPOINT", "RELEASE", "ROLLBACK")):
+                statements.append(statement)
+
+        engine = populated_db.get_bind()
+        event.listen(engine, "before_cursor_execute", count_statement)
+        try:
+            Repository(populated_db).get_stats()
+        finally:
+            event.remove(engine, "before_cursor_execute", count_statement)
+
+        assert len(statements) <= 3
+
+    def test_get_stats_cached_and_invalidated(self, populated_db):
+        """Test that stats are cached and invalidated by writes."""
+        repo = Repository(populated_db)
+        before = repo.get_stats()
+        assert repo.get_stats() is before
+
+        repo.update_video_status("v2", "processed")
+        after = repo.get_stats()
+        assert after is not before
+        assert after["processed_videos"] == 2
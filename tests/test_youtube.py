@@ -39,6 +39,101 @@ class TestYouTubeSource:
         assert video_id is None
 
 
+_FEED_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns:yt="http://www.youtube.com/xml/schemas/2015"
+      xmlns="http://www.w3.org/2005/Atom">
+  <title>Test Channel</title>
+{entries}
+</feed>"""
+
+
+def _make_feed(entries: str) -> bytes:
+    """Build an Atom feed document around the given entry XML."""
+    return _FEED_TEMPLATE.format(entries=entries).encode()
+
+
+class TestParseFeed:
+    """Tests for Atom feed parsing."""
+
+    def test_parse_entry_with_video_id(self):
+        """Test parsing an entry carrying yt:videoId."""
+        feed = _make_feed("""
+  <entry>
+    <yt:videoId>dQw4w9WgXcQ</yt:videoId>
+    <title>Test Video</title>
+    <link rel="alternate" href="https://www.youtube.com/watch?v=dQw4w9WgXcQ"/>
+    <published>2024-01-15T10:30:00+00:00</published>
+  </entry>""")
+        source = YouTubeSource()
+        videos = source._parse_feed(feed, "UC_test", max_videos=10)
+        assert len(videos) == 1
+        assert videos[0].id == "dQw4w9WgXcQ"
+        assert videos[0].channel_id == "UC_test"
+        assert videos[0].title == "Test Video"
+        assert videos[0].url == "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+        assert videos[0].published_at is not None
+        assert videos[0].published_at.year == 2024
+
+    def test_parse_entry_link_fallback(self):
+        """Test that entries without yt:videoId fall back to the link href."""
+        feed = _make_feed("""
+  <entry>
+    <title>Fallback Video</title>
+    <link rel="alternate" href="https://www.youtube.com/watch?v=abcdefghijk"/>
+  </entry>""")
+        source = YouTubeSource()
+        videos = source._parse_feed(feed, "UC_test", max_videos=10)
+        assert len(videos) == 1
+        assert videos[0].id == "abcdefghijk"
+
+    def test_parse_entry_missing_published(self):
+        """Test that a missing published date yields published_at=None."""
+        feed = _make_feed("""
+  <entry>
+    <yt:videoId>dQw4w9WgXcQ</yt:videoId>
+    <title>Undated Video</title>
+  </entry>""")
+        source = YouTubeSource()
+        videos = source._parse_feed(feed, "UC_test", max_videos=10)
+        assert len(videos) == 1
+        assert videos[0].published_at is None
+
+    def test_parse_entry_zulu_timestamp(self):
+        """Test parsing a published date with a Z suffix."""
+        feed = _make_feed("""
+  <entry>
+    <yt:videoId>dQw4w9WgXcQ</yt:videoId>
+    <title>Zulu Video</title>
+    <published>2024-01-15T10:30:00Z</published>
+  </entry>""")
+        source = YouTubeSource()
+        videos = source._parse_feed(feed, "UC_test", max_videos=10)
+        assert videos[0].published_at is not None
+
+    def test_parse_feed_respects_max_videos(self):
+        """Test that max_videos caps the number of parsed entries."""
+        entry = """
+  <entry>
+    <yt:videoId>vid{n:08d}abc</yt:videoId>
+    <title>Video {n}</title>
+  </entry>"""
+        feed = _make_feed("".join(entry.format(n=n) for n in range(5)))
+        source = YouTubeSource()
+        videos = source._parse_feed(feed, "UC_test", max_videos=3)
+        assert len(videos) == 3
+
+    def test_parse_feed_malformed_xml(self):
+        """Test that malformed XML returns an empty list."""
+        source = YouTubeSource()
+        assert source._parse_feed(b"<feed><entry>", "UC_test", max_videos=10) == []
+        assert source._parse_feed(b"not xml at all", "UC_test", max_videos=10) == []
+
+    def test_parse_feed_no_entries(self):
+        """Test that a feed without entries returns an empty list."""
+        source = YouTubeSource()
+        assert source._parse_feed(_make_feed(""), "UC_test", max_videos=10) == []
+
+
 class TestVideoInfo:
     """Tests for VideoInfo dataclass."""
 